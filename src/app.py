@@ -10,6 +10,7 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.responses import RedirectResponse
 import os
 from pathlib import Path
+from dataclasses import dataclass
 
 app = FastAPI(title="Mergington High School API",
               description="API for viewing and signing up for extracurricular activities")
@@ -19,62 +20,72 @@ current_dir = Path(__file__).parent
 app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
           "static")), name="static")
 
+
+@dataclass(slots=True)
+class Activity:
+    """An extracurricular activity and the students signed up for it"""
+    description: str
+    schedule: str
+    max_participants: int
+    participants: set[str]
+
+
 # In-memory activity database
 activities = {
-    "Chess Club": {
-        "description": "Learn strategies and compete in chess tournaments",
-        "schedule": "Fridays, 3:30 PM - 5:00 PM",
-        "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-    },
-    "Programming Class": {
-        "description": "Learn programming fundamentals and build software projects",
-        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-        "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-    },
-    "Debate Club": {
-        "description": "Develop critical thinking and public speaking skills through competitive debates",
-        "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-        "max_participants": 16,
-        "participants": ["alice@mergington.edu"]
-    },
-    "Science Olympiad": {
-        "description": "Prepare for regional and national science competitions",
-        "schedule": "Mondays and Thursdays, 3:30 PM - 5:00 PM",
-        "max_participants": 15,
-        "participants": ["sarah@mergington.edu", "david@mergington.edu"]
-    },
-    "Art Studio": {
-        "description": "Explore various art mediums including painting, drawing, and sculpture",
-        "schedule": "Tuesdays, 3:00 PM - 5:00 PM",
-        "max_participants": 18,
-        "participants": ["maria@mergington.edu"]
-    },
-    "Drama Club": {
-        "description": "Participate in theatrical productions and improve acting skills",
-        "schedule": "Thursdays, 4:00 PM - 6:00 PM",
-        "max_participants": 25,
-        "participants": ["james@mergington.edu", "lily@mergington.edu"]
-    },
-    "Gym Class": {
-        "description": "Physical education and sports activities",
-        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-        "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-    },
-    "Basketball Team": {
-        "description": "Competitive basketball team for inter-school tournaments",
-        "schedule": "Tuesdays and Thursdays, 4:00 PM - 6:00 PM",
-        "max_participants": 15,
-        "participants": ["chris@mergington.edu", "alex@mergington.edu"]
-    },
-    "Swimming Club": {
-        "description": "Learn swimming techniques and train for competitions",
-        "schedule": "Mondays and Wednesdays, 3:00 PM - 4:30 PM",
-        "max_participants": 20,
-        "participants": ["emily@mergington.edu"]
-    }
+    "Chess Club": Activity(
+        description="Learn strategies and compete in chess tournaments",
+        schedule="Fridays, 3:30 PM - 5:00 PM",
+        max_participants=12,
+        participants={"michael@mergington.edu", "daniel@mergington.edu"}
+    ),
+    "Programming Class": Activity(
+        description="Learn programming fundamentals and build software projects",
+        schedule="Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+        max_participants=20,
+        participants={"emma@mergington.edu", "sophia@mergington.edu"}
+    ),
+    "Debate Club": Activity(
+        description="Develop critical thinking and public speaking skills through competitive debates",
+        schedule="Wednesdays, 3:30 PM - 5:00 PM",
+        max_participants=16,
+        participants={"alice@mergington.edu"}
+    ),
+    "Science Olympiad": Activity(
+        description="Prepare for regional and national science competitions",
+        schedule="Mondays and Thursdays, 3:30 PM - 5:00 PM",
+        max_participants=15,
+        participants={"sarah@mergington.edu", "david@mergington.edu"}
+    ),
+    "Art Studio": Activity(
+        description="Explore various art mediums including painting, drawing, and sculpture",
+        schedule="Tuesdays, 3:00 PM - 5:00 PM",
+        max_participants=18,
+        participants={"maria@mergington.edu"}
+    ),
+    "Drama Club": Activity(
+        description="Participate in theatrical productions and improve acting skills",
+        schedule="Thursdays, 4:00 PM - 6:00 PM",
+        max_participants=25,
+        participants={"james@mergington.edu", "lily@mergington.edu"}
+    ),
+    "Gym Class": Activity(
+        description="Physical education and sports activities",
+        schedule="Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+        max_participants=30,
+        participants={"john@mergington.edu", "olivia@mergington.edu"}
+    ),
+    "Basketball Team": Activity(
+        description="Competitive basketball team for inter-school tournaments",
+        schedule="Tuesdays and Thursdays, 4:00 PM - 6:00 PM",
+        max_participants=15,
+        participants={"chris@mergington.edu", "alex@mergington.edu"}
+    ),
+    "Swimming Club": Activity(
+        description="Learn swimming techniques and train for competitions",
+        schedule="Mondays and Wednesdays, 3:00 PM - 4:30 PM",
+        max_participants=20,
+        participants={"emily@mergington.edu"}
+    )
 }
 
 
@@ -87,11 +98,14 @@ def root():
 def get_activities():
     """Get all activities with participant counts and availability"""
     result = {}
-    for name, data in activities.items():
+    for name, activity in activities.items():
         result[name] = {
-            **data,
-            "current_participants": len(data["participants"]),
-            "available_spots": data["max_participants"] - len(data["participants"])
+            "description": activity.description,
+            "schedule": activity.schedule,
+            "max_participants": activity.max_participants,
+            "participants": sorted(activity.participants),
+            "current_participants": len(activity.participants),
+            "available_spots": activity.max_participants - len(activity.participants)
         }
     return result
 
@@ -107,11 +121,11 @@ def signup_for_activity(activity_name: str, email: str):
     activity = activities[activity_name]
 
         # Validate student is not already signed up
-    if email in activity["participants"]:
+    if email in activity.participants:
         raise HTTPException(status_code=400, detail="Student is already signed up for this activity")
 
     # Add student
-    activity["participants"].append(email)
+    activity.participants.add(email)
     return {"message": f"Signed up {email} for {activity_name}"}
 
 
@@ -126,9 +140,9 @@ def unregister_from_activity(activity_name: str, email: str):
     activity = activities[activity_name]
 
     # Validate student is signed up
-    if email not in activity["participants"]:
+    if email not in activity.participants:
         raise HTTPException(status_code=404, detail="Student is not signed up for this activity")
 
     # Remove student
-    activity["participants"].remove(email)
+    activity.participants.remove(email)
     return {"message": f"Unregistered {email} from {activity_name}"}
@@ -0,0 +1,30 @@
+"""
+Shared pytest configuration for the Mergington High School Activities API tests
+"""
+import httpx
+import orjson
+import pytest
+
+
+def pytest_addoption(parser):
+    """Add the --skip-slow command line option"""
+    parser.addoption("--skip-slow", action="store_true", default=False,
+                     help="skip tests marked as slow")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked as slow when --skip-slow is given"""
+    if not config.getoption("--skip-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test skipped by --skip-slow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def orjson_responses():
+    """Decode test client JSON responses with orjson"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(httpx.Response, "json", lambda self, **kwargs: orjson.loads(self.content))
+        yield
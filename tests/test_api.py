@@ -1,47 +1,142 @@
 """
 Tests for the Mergington High School Activities API
 """
+import asyncio
+import copy
+from urllib.parse import quote, urlencode
+
+import httpx
+import orjson
 import pytest
 from fastapi.testclient import TestClient
-from src.app import app, activities
+from src.app import Activity, app, activities
 
+# Known activity data that every test starts from
+BASELINE_ACTIVITIES = {
+    "Chess Club": Activity(
+        description="Learn strategies and compete in chess tournaments",
+        schedule="Fridays, 3:30 PM - 5:00 PM",
+        max_participants=12,
+        participants={"michael@mergington.edu", "daniel@mergington.edu"}
+    ),
+    "Programming Class": Activity(
+        description="Learn programming fundamentals and build software projects",
+        schedule="Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+        max_participants=20,
+        participants={"emma@mergington.edu", "sophia@mergington.edu"}
+    )
+}
 
-@pytest.fixture
+
+async def _dispatch(method, path, query_string):
+    """Send a single bodiless HTTP request through the ASGI app"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": quote(path).encode(),
+        "root_path": "",
+        "query_string": query_string,
+        "headers": [],
+        "server": ("test", 80),
+        "client": ("test", 12345),
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+    return messages
+
+
+def call_app(method, path, **params):
+    """Call the app without an HTTP client, for the hot success paths; return (status, headers, body)"""
+    messages = asyncio.run(_dispatch(method, path, urlencode(params).encode()))
+    status = messages[0]["status"]
+    headers = {
+        name.decode("latin-1"): value.decode("latin-1")
+        for name, value in messages[0]["headers"]
+    }
+    body = b"".join(message.get("body", b"") for message in messages[1:])
+    if headers.get("content-type", "").startswith("application/json"):
+        return status, headers, orjson.loads(body)
+    return status, headers, body
+
+
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client"""
-    return TestClient(app)
+    """Create a test client shared across the whole test session"""
+    with TestClient(app) as client:
+        yield client
 
 
-@pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities data before each test"""
+@pytest.fixture(scope="session")
+def anyio_backend():
+    """Run async tests on asyncio only"""
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+async def async_client(anyio_backend):
+    """Create an async client that dispatches straight to the ASGI app"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
+def load_baseline_activities():
+    """Replace the in-memory activities with a fresh copy of the baseline"""
     activities.clear()
-    activities.update({
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        }
-    })
+    activities.update(copy.deepcopy(BASELINE_ACTIVITIES))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def baseline_activities():
+    """Load the baseline activities once for the whole test session"""
+    load_baseline_activities()
+
+
+@pytest.fixture(scope="class")
+def activities_response(client):
+    """Fetch the activities once for a class of read-only tests"""
+    return client.get("/activities")
+
+
+@pytest.fixture
+def reset_activities():
+    """Restore the baseline activities after a test that modifies them"""
     yield
+    load_baseline_activities()
+
+
+@pytest.fixture
+def art_and_craft():
+    """Add an activity with special characters in its name for one test"""
+    activities["Art & Craft"] = Activity(
+        description="Creative arts",
+        schedule="Mondays",
+        max_participants=10,
+        participants=set()
+    )
+    yield
+    activities.pop("Art & Craft", None)
 
 
 class TestGetActivities:
     """Tests for GET /activities endpoint"""
 
-    def test_get_activities_success(self, client):
+    def test_get_activities_success(self, activities_response):
         """Test retrieving all activities"""
-        response = client.get("/activities")
-        assert response.status_code == 200
+        assert activities_response.status_code == 200
         
-        data = response.json()
+        data = activities_response.json()
         assert "Chess Club" in data
         assert "Programming Class" in data
         
@@ -49,14 +144,13 @@ class TestGetActivities:
         chess = data["Chess Club"]
         assert chess["description"] == "Learn strategies and compete in chess tournaments"
         assert chess["max_participants"] == 12
-        assert len(chess["participants"]) == 2
+        assert chess["participants"] == ["daniel@mergington.edu", "michael@mergington.edu"]
         assert chess["current_participants"] == 2
         assert chess["available_spots"] == 10
 
-    def test_get_activities_includes_participant_count(self, client):
+    def test_get_activities_includes_participant_count(self, activities_response):
         """Test that activities include participant counts"""
-        response = client.get("/activities")
-        data = response.json()
+        data = activities_response.json()
         
         for activity_name, activity_data in data.items():
             assert "current_participants" in activity_data
@@ -65,33 +159,24 @@ class TestGetActivities:
             assert activity_data["available_spots"] == activity_data["max_participants"] - activity_data["current_participants"]
 
 
+@pytest.mark.usefixtures("reset_activities")
 class TestSignupForActivity:
     """Tests for POST /activities/{activity_name}/signup endpoint"""
 
-    def test_signup_success(self, client):
+    def test_signup_success(self):
         """Test successful signup for an activity"""
-        response = client.post(
-            "/activities/Chess Club/signup?email=newstudent@mergington.edu"
+        status, headers, data = call_app(
+            "POST", "/activities/Chess Club/signup", email="newstudent@mergington.edu"
         )
-        assert response.status_code == 200
+        assert status == 200
+        assert headers["content-type"] == "application/json"
         
-        data = response.json()
         assert "message" in data
         assert "newstudent@mergington.edu" in data["message"]
         assert "Chess Club" in data["message"]
         
         # Verify participant was added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "newstudent@mergington.edu" in activities_data["Chess Club"]["participants"]
-
-    def test_signup_activity_not_found(self, client):
-        """Test signup for non-existent activity"""
-        response = client.post(
-            "/activities/NonExistent Club/signup?email=test@mergington.edu"
-        )
-        assert response.status_code == 404
-        assert "Activity not found" in response.json()["detail"]
+        assert "newstudent@mergington.edu" in activities["Chess Club"].participants
 
     def test_signup_already_registered(self, client):
         """Test signup when student is already registered"""
@@ -99,68 +184,62 @@ class TestSignupForActivity:
             "/activities/Chess Club/signup?email=michael@mergington.edu"
         )
         assert response.status_code == 400
-        assert "already signed up" in response.json()["detail"]
+        assert b"already signed up" in response.content
 
     def test_signup_updates_participant_list(self, client):
         """Test that signup properly updates the participant list"""
-        initial_response = client.get("/activities")
-        initial_count = len(initial_response.json()["Chess Club"]["participants"])
+        initial_count = len(activities["Chess Club"].participants)
         
         client.post("/activities/Chess Club/signup?email=new@mergington.edu")
         
-        updated_response = client.get("/activities")
-        updated_count = len(updated_response.json()["Chess Club"]["participants"])
-        
-        assert updated_count == initial_count + 1
+        assert len(activities["Chess Club"].participants) == initial_count + 1
 
 
+@pytest.mark.usefixtures("reset_activities")
 class TestUnregisterFromActivity:
     """Tests for DELETE /activities/{activity_name}/unregister endpoint"""
 
-    def test_unregister_success(self, client):
+    def test_unregister_success(self):
         """Test successful unregistration from an activity"""
-        response = client.delete(
-            "/activities/Chess Club/unregister?email=michael@mergington.edu"
+        status, headers, data = call_app(
+            "DELETE", "/activities/Chess Club/unregister", email="michael@mergington.edu"
         )
-        assert response.status_code == 200
+        assert status == 200
+        assert headers["content-type"] == "application/json"
         
-        data = response.json()
         assert "message" in data
         assert "michael@mergington.edu" in data["message"]
         assert "Chess Club" in data["message"]
         
         # Verify participant was removed
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "michael@mergington.edu" not in activities_data["Chess Club"]["participants"]
-
-    def test_unregister_activity_not_found(self, client):
-        """Test unregister from non-existent activity"""
-        response = client.delete(
-            "/activities/NonExistent Club/unregister?email=test@mergington.edu"
-        )
-        assert response.status_code == 404
-        assert "Activity not found" in response.json()["detail"]
-
-    def test_unregister_not_registered(self, client):
-        """Test unregister when student is not registered"""
-        response = client.delete(
-            "/activities/Chess Club/unregister?email=notregistered@mergington.edu"
-        )
-        assert response.status_code == 404
-        assert "not signed up" in response.json()["detail"]
+        assert "michael@mergington.edu" not in activities["Chess Club"].participants
 
     def test_unregister_updates_participant_list(self, client):
         """Test that unregister properly updates the participant list"""
-        initial_response = client.get("/activities")
-        initial_count = len(initial_response.json()["Chess Club"]["participants"])
+        initial_count = len(activities["Chess Club"].participants)
         
         client.delete("/activities/Chess Club/unregister?email=michael@mergington.edu")
         
-        updated_response = client.get("/activities")
-        updated_count = len(updated_response.json()["Chess Club"]["participants"])
-        
-        assert updated_count == initial_count - 1
+        assert len(activities["Chess Club"].participants) == initial_count - 1
+
+
+class TestNotFound:
+    """Tests for 404 responses from the signup and unregister endpoints"""
+
+    @pytest.mark.parametrize("method,path,detail", [
+        ("post", "/activities/NonExistent Club/signup?email=test@mergington.edu",
+         b"Activity not found"),
+        ("delete", "/activities/NonExistent Club/unregister?email=test@mergington.edu",
+         b"Activity not found"),
+        ("delete", "/activities/Chess Club/unregister?email=notregistered@mergington.edu",
+         b"not signed up"),
+    ], ids=["signup_activity_not_found", "unregister_activity_not_found",
+            "unregister_not_registered"])
+    def test_not_found(self, client, method, path, detail):
+        """Test requests for missing activities or participants"""
+        response = getattr(client, method)(path)
+        assert response.status_code == 404
+        assert detail in response.content
 
 
 class TestRootEndpoint:
@@ -176,42 +255,40 @@ class TestRootEndpoint:
 class TestEdgeCases:
     """Tests for edge cases and special scenarios"""
 
-    def test_signup_with_special_characters_in_activity_name(self, client):
+    def test_signup_with_special_characters_in_activity_name(self, client, art_and_craft):
         """Test signup with URL-encoded activity name"""
-        # Add an activity with special characters
-        activities["Art & Craft"] = {
-            "description": "Creative arts",
-            "schedule": "Mondays",
-            "max_participants": 10,
-            "participants": []
-        }
-        
         response = client.post(
             "/activities/Art & Craft/signup?email=test@mergington.edu"
         )
         assert response.status_code == 200
 
-    def test_multiple_signups_and_unregisters(self, client):
+    @pytest.mark.slow
+    @pytest.mark.anyio
+    @pytest.mark.usefixtures("reset_activities")
+    async def test_multiple_signups_and_unregisters(self, async_client):
         """Test multiple signup and unregister operations"""
-        # Multiple signups
+        # Multiple signups, dispatched concurrently
         emails = ["test1@mergington.edu", "test2@mergington.edu", "test3@mergington.edu"]
-        for email in emails:
-            response = client.post(f"/activities/Chess Club/signup?email={email}")
+        responses = await asyncio.gather(*(
+            async_client.post("/activities/Chess Club/signup", params={"email": email})
+            for email in emails
+        ))
+        for response in responses:
             assert response.status_code == 200
         
         # Verify all added
-        activities_response = client.get("/activities")
-        participants = activities_response.json()["Chess Club"]["participants"]
+        participants = activities["Chess Club"].participants
         for email in emails:
             assert email in participants
         
         # Unregister one
-        response = client.delete("/activities/Chess Club/unregister?email=test2@mergington.edu")
+        response = await async_client.delete(
+            "/activities/Chess Club/unregister", params={"email": "test2@mergington.edu"}
+        )
         assert response.status_code == 200
         
         # Verify removed
-        activities_response = client.get("/activities")
-        participants = activities_response.json()["Chess Club"]["participants"]
+        participants = activities["Chess Club"].participants
         assert "test2@mergington.edu" not in participants
         assert "test1@mergington.edu" in participants
         assert "test3@mergington.edu" in participants